@@ -1,3 +1,5 @@
+import html
+import re
 from abc import ABC, abstractmethod
 from optparse import Option
 from typing import List, Dict, Any, Optional, Union
@@ -9,7 +11,7 @@ from recipe_scrapers import SCRAPERS, scrape_me
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroNutrition:
     """
     Structured nutritional macro information for recipes.
@@ -52,7 +54,7 @@ class MacroNutrition:
     cholesterol: Optional[float] = None  # milligrams
 
 
-@dataclass
+@dataclass(slots=True)
 class IngredientData:
     """
     Structured ingredient data with quantity, unit, and name components.
@@ -85,7 +87,7 @@ class IngredientData:
     original_text: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RecipeData:
     """
     Standardized recipe data structure for all recipe scrapers.
@@ -405,9 +407,14 @@ class BaseRecipeProvider(ABC):
                     instructions=raw_data.get('instructions', []),
                     source_url=source_url,
                     provider=self.provider_name,
-                    scraped_at=datetime.now().isoformat()
                 )
             ```
+
+        Note:
+            Timestamps (e.g. scraped_at) should be stamped by the caller
+            that persists the recipe, not built here - constructing
+            datetimes per normalization is wasted work on the scraping hot
+            path.
         """
         pass
 
@@ -426,9 +433,6 @@ class BaseRecipeProvider(ABC):
         if not text:
             return None
 
-        import html
-        import re
-
         # Decode HTML entities
         text = html.unescape(text)
 
@@ -449,8 +453,6 @@ class BaseRecipeProvider(ABC):
         if not rating_str:
             return None
 
-        import re
-
         # Extract decimal number from rating string
         match = re.search(r"(\d+\.?\d*)", rating_str)
         if match:
@@ -512,15 +514,19 @@ class BaseRecipeProvider(ABC):
             ...     print("Ready to scrape Budget Bytes recipes")
         """
         try:
-            # Check if Budget Bytes is supported by recipe-scrapers
-            supported_sites: List[str] = SCRAPERS.keys()
-
+            # SCRAPERS is keyed on host names, so direct lookups replace the
+            # scan-and-lowercase over every supported site
             is_supported: bool = any(
-                recipe_provider_scraper_name in site.lower() for site in supported_sites
+                host in SCRAPERS
+                for host in (
+                    recipe_provider_scraper_name,
+                    f"{recipe_provider_scraper_name}.com",
+                    f"www.{recipe_provider_scraper_name}.com",
+                )
             )
 
             logger.info(
-                f"Scraper configuration validated - Is supported: {is_supported}, Total supported sites: {len(supported_sites)}"
+                f"Scraper configuration validated - Is supported: {is_supported}, Total supported sites: {len(SCRAPERS)}"
             )
 
             return is_supported
@@ -1,23 +1,33 @@
 """BudgetBytes recipe provider constants."""
 
+import re
+
 # Base URLs and configuration
 BUDGET_BYTES_BASE_URL: str = "https://www.budgetbytes.com"
 BUDGET_BYTES_DOMAIN: str = "budgetbytes.com"
 BUDGET_BYTES_RATE_LIMIT: float = 2.0
 BUDGET_BYTES_TIMEOUT: int = 30
 
+# Use the slower regex-based cost cleanup instead of the single-pass scan
+# (kept for correctness comparison against _remove_cost_info_regex)
+BUDGET_BYTES_USE_REGEX_COST_CLEANUP: bool = False
+
+# On-disk cache of parsed sitemap shards, revalidated with conditional GETs
+# (If-None-Match / If-Modified-Since); a 304 skips the download and reparse
+BUDGET_BYTES_SITEMAP_CACHE_PATH: str = "~/.cache/nourishly/budgetbytes_sitemap.json"
+
 # Sitemap configuration
-BUDGET_BYTES_SITEMAP_URLS = [
+BUDGET_BYTES_SITEMAP_URLS = (
     "https://www.budgetbytes.com/post-sitemap.xml",
     "https://www.budgetbytes.com/post-sitemap2.xml",
-]
+)
 
 BUDGET_BYTES_SITEMAP_NAMESPACE = {
     "sitemap": "http://www.sitemaps.org/schemas/sitemap/0.9"
 }
 
 # Category URLs for recipe discovery
-BUDGET_BYTES_CATEGORY_URLS = [
+BUDGET_BYTES_CATEGORY_URLS = (
     "https://www.budgetbytes.com/category/recipes/main-dish/",
     "https://www.budgetbytes.com/category/recipes/side-dish/",
     "https://www.budgetbytes.com/category/recipes/breakfast/",
@@ -25,16 +35,19 @@ BUDGET_BYTES_CATEGORY_URLS = [
     "https://www.budgetbytes.com/category/recipes/dessert/",
     "https://www.budgetbytes.com/category/recipes/soup/",
     "https://www.budgetbytes.com/category/recipes/salad/",
-]
+)
 
-# Recipe URL patterns
-BUDGET_BYTES_RECIPE_PATTERNS = [
-    r"budgetbytes\.com/[^/]+/$",  # Single recipe pages like /recipe-name/
-    r"budgetbytes\.com/[a-z0-9-]+/$",  # Recipe slugs (letters, numbers, hyphens)
-]
+# Recipe URL pattern: a single anchored regex for recipe slugs (one path
+# segment of 4+ letters/numbers/hyphens). The two patterns it replaces
+# overlapped, and the anchor also absorbs the old "simple path" length
+# heuristic, so filtering needs one match instead of several searches plus
+# a path split.
+BUDGET_BYTES_RECIPE_PATTERNS = (
+    r"^https?://(?:www\.)?budgetbytes\.com/[a-z0-9][a-z0-9-]{3,}/?$",
+)
 
 # Excluded URL patterns (non-recipe pages)
-BUDGET_BYTES_EXCLUDED_RECIPE_PATTERNS = [
+BUDGET_BYTES_EXCLUDED_RECIPE_PATTERNS = (
     r"budgetbytes\.com/category/",  # Category pages
     r"budgetbytes\.com/tag/",  # Tag pages
     r"budgetbytes\.com/page/",  # Pagination
@@ -58,4 +71,34 @@ BUDGET_BYTES_EXCLUDED_RECIPE_PATTERNS = [
     r"budgetbytes\.com/top-\d+",  # Top N recipes posts
     r"budgetbytes\.com/.*-\d{4}/$",  # Year-based compilation posts (e.g., best-of-2023)
     r"budgetbytes\.com/prices-and-portions",  # Non-recipe informational pages
-]
+)
+
+# Literal URL prefixes covering the fixed-prefix exclusions above; checked
+# with str.startswith before any regex runs since most sitemap URLs that get
+# excluded match one of these
+BUDGET_BYTES_EXCLUDED_LITERAL_PREFIXES = tuple(
+    f"{BUDGET_BYTES_BASE_URL}/{path}"
+    for path in (
+        "category/",
+        "tag/",
+        "page/",
+        "author/",
+        "search/",
+        "index/",
+        "extra-bytes/",
+        "feeding-america",
+        "roundup",
+        "prices-and-portions",
+    )
+)
+
+# Compiled unions of the pattern lists above, built once at import time so
+# URL filtering runs two regex searches per URL instead of one per pattern
+BUDGET_BYTES_RECIPE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in BUDGET_BYTES_RECIPE_PATTERNS),
+    re.IGNORECASE,
+)
+BUDGET_BYTES_EXCLUDED_RECIPE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in BUDGET_BYTES_EXCLUDED_RECIPE_PATTERNS),
+    re.IGNORECASE,
+)
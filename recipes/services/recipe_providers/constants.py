@@ -1,7 +1,10 @@
-from ast import Str
 
 
-COMMON_UNITS = [
+# Use urlparse-based provider URL validation instead of the string fast path
+# (see is_recipe_provider_url_strict; intended for untrusted URL sources)
+STRICT_PROVIDER_URL_VALIDATION: bool = False
+
+COMMON_UNITS = (
     "tablespoons",
     "tablespoon",
     "teaspoons",
@@ -54,30 +57,32 @@ COMMON_UNITS = [
     "g",
     "l",
     "c",
-]
+)
 
+# Values are spelled as float literals (full double precision) so import
+# just loads constants instead of evaluating divisions
 UNICODE_FRACTIONS = {
     "¼": 0.25,
     "½": 0.5,
     "¾": 0.75,
-    "⅐": 1 / 7,
-    "⅑": 1 / 9,
+    "⅐": 0.14285714285714285,  # 1/7
+    "⅑": 0.1111111111111111,  # 1/9
     "⅒": 0.1,
-    "⅓": 1 / 3,
-    "⅔": 2 / 3,
+    "⅓": 0.3333333333333333,  # 1/3
+    "⅔": 0.6666666666666666,  # 2/3
     "⅕": 0.2,
     "⅖": 0.4,
     "⅗": 0.6,
     "⅘": 0.8,
-    "⅙": 1 / 6,
-    "⅚": 5 / 6,
+    "⅙": 0.16666666666666666,  # 1/6
+    "⅚": 0.8333333333333334,  # 5/6
     "⅛": 0.125,
     "⅜": 0.375,
     "⅝": 0.625,
     "⅞": 0.875,
 }
 
-MACROS_TO_EXTRACT = [
+MACROS_TO_EXTRACT = (
     "calories",
     "protein",
     "carbohydrates",
@@ -85,4 +90,4 @@ MACROS_TO_EXTRACT = [
     "fiber",
     "sugar",
     "sodium",
-]
\ No newline at end of file
+)
\ No newline at end of file
@@ -1,5 +1,4 @@
 import re
-from fractions import Fraction
 from typing import Optional, Tuple, Any, List
 from urllib.parse import ParseResult, urlparse
 
@@ -7,6 +6,14 @@ from recipes.utils import parse_time_string
 from recipes.services.recipe_providers import constants
 
 
+# Precompiled patterns for the per-ingredient parsing helpers below, hoisted
+# to module scope so hot callers skip the re-cache lookup on every call.
+# The fraction pattern covers mixed numbers ("1 1/2") and simple fractions
+# ("1/2") in one match via the optional whole-number group.
+_FRACTION_RE = re.compile(r"(?:(\d+)\s+)?(\d+)/(\d+)")
+_PAREN_NOTES_RE = re.compile(r"\(([^)]+)\)")
+
+
 def parse_quantity(quantity_str: str) -> Optional[float]:
         """Parse quantity string to float, handling fractions and mixed numbers.
 
@@ -17,31 +24,41 @@ def parse_quantity(quantity_str: str) -> Optional[float]:
             Optional[float]: Parsed quantity or None if parsing fails.
         """
 
+        # Strip once up front so trailing/leading whitespace ("½ ") doesn't
+        # defeat the last-character fraction lookup below; float() tolerates
+        # it, but the [-1] index does not
+        quantity_str = quantity_str.strip()
+
+        try:
+            # Fast path: most quantities are plain integers or decimals,
+            # which a single C-level float() call handles
+            return float(quantity_str)
+        except ValueError:
+            pass
+
         try:
-            for unicode_fraction, fraction_value in constants.UNICODE_FRACTIONS.items():
-                if unicode_fraction in quantity_str:
-                    # Handle mixed numbers like "1¼"
-                    number_parts = quantity_str.split(unicode_fraction)
-                    if number_parts[0].strip():
-                        return float(number_parts[0].strip()) + fraction_value
-                    else:
-                        return fraction_value
-
-            # Handle mixed numbers like "1 1/2"
-            mixed_number_match = re.match(r"(\d+)\s+(\d+)/(\d+)", quantity_str.strip())
-            if mixed_number_match:
-                whole_number = int(mixed_number_match.group(1))
-                fraction_part = Fraction(
-                    int(mixed_number_match.group(2)), int(mixed_number_match.group(3))
-                )
-                return float(whole_number + fraction_part)
-
-            # Handle simple fractions like "1/2"
-            if "/" in quantity_str:
-                return float(Fraction(quantity_str.strip()))
-
-            # Handle decimal numbers
-            return float(quantity_str.strip())
+            # Unicode fractions are single code points and always trail the
+            # whole-number part ("¼", "1¼"), so a direct lookup on the last
+            # character replaces the linear scan over UNICODE_FRACTIONS
+            if quantity_str:
+                fraction_value = constants.UNICODE_FRACTIONS.get(quantity_str[-1])
+                if fraction_value is not None:
+                    whole_number_part = quantity_str[:-1].strip()
+                    if whole_number_part:
+                        return float(whole_number_part) + fraction_value
+                    return fraction_value
+
+            # Handle mixed numbers ("1 1/2") and simple fractions ("1/2")
+            # with one fused match
+            fraction_match = _FRACTION_RE.fullmatch(quantity_str)
+            if fraction_match:
+                whole_number, numerator, denominator = fraction_match.groups()
+                quantity_value = int(numerator) / int(denominator)
+                if whole_number:
+                    quantity_value += int(whole_number)
+                return quantity_value
+
+            return None
 
         except (ValueError, ZeroDivisionError):
             return None
@@ -58,31 +75,64 @@ def extract_name_and_notes(text: str) -> Tuple[str, Optional[str]]:
         """
 
         # Look for notes in parentheses
-        parentheses_match = re.search(r"\(([^)]+)\)", text)
+        parentheses_match = _PAREN_NOTES_RE.search(text)
         if parentheses_match:
             preparation_notes = parentheses_match.group(1).strip()
-            ingredient_name = re.sub(r"\([^)]+\)", "", text).strip()
+            ingredient_name = _PAREN_NOTES_RE.sub("", text).strip()
             return ingredient_name, preparation_notes if preparation_notes else None
 
         return text.strip(), None
 
 def is_recipe_provider_url(url: str,recipe_provider_domain:str) -> bool:
-        """Check if the URL is from Budget Bytes website.
+        """Check if the URL belongs to the given recipe provider domain.
 
         Args:
             url (str): URL to validate.
+            recipe_provider_domain (str): Provider domain to match against.
 
         Returns:
-            bool: True if URL is from budgetbytes.com domain, False otherwise.
+            bool: True if URL is from the provider's domain, False otherwise.
 
         Note:
-            This validation ensures the scraper only processes Budget Bytes URLs
-            and prevents accidental scraping of other websites.
+            This validation ensures scrapers only process URLs from their own
+            provider and prevents accidental scraping of other websites.
+            Checks the host portion with plain string slicing instead of a
+            full urlparse, which allocates a ParseResult and several strings
+            per call; is_recipe_provider_url_strict keeps the parser-based
+            check behind constants.STRICT_PROVIDER_URL_VALIDATION.
+        """
+        if constants.STRICT_PROVIDER_URL_VALIDATION:
+            return is_recipe_provider_url_strict(url, recipe_provider_domain)
+
+        if not url:
+            return False
+
+        lowered_url = url.lower()
+
+        # Isolate the host portion (between "://" and the first "/")
+        scheme_separator = lowered_url.find("://")
+        host_start = scheme_separator + 3 if scheme_separator != -1 else 0
+        host_end = lowered_url.find("/", host_start)
+        if host_end == -1:
+            host_end = len(lowered_url)
+
+        return recipe_provider_domain.lower() in lowered_url[host_start:host_end]
+
+
+def is_recipe_provider_url_strict(url: str, recipe_provider_domain: str) -> bool:
+        """Parser-based provider URL check kept for untrusted inputs.
+
+        Args:
+            url (str): URL to validate.
+            recipe_provider_domain (str): Provider domain to match against.
+
+        Returns:
+            bool: True if URL is from the provider's domain, False otherwise.
         """
         try:
             parsed: ParseResult = urlparse(url)
             return recipe_provider_domain.lower() in parsed.netloc.lower()
-        except:
+        except (ValueError, AttributeError):
             return False
 
 def parse_time_duration(duration: Any) -> Optional[int]:
@@ -7,57 +7,65 @@ from recipes.utils import (
     extract_numeric_value_from_string,
     safely_extract_info_from_function_call,
 )
-from recipes.services.recipe_providers import constants
 
 logger = logging.getLogger(__name__)
 
+# Maps MacroNutrition fields to their keys in the scraper nutrients dict
+_NUTRIENT_KEYS = {
+    "calories": "calories",
+    "protein": "proteinContent",
+    "carbohydrates": "carbohydrateContent",
+    "fat": "fatContent",
+    "fiber": "fiberContent",
+    "sugar": "sugarContent",
+    "sodium": "sodiumContent",
+    "saturated_fat": "saturatedFatContent",
+    "cholesterol": "cholesterolContent",
+}
 
-def extract_macros(scraper: Any) -> Optional[MacroNutrition]:
-    """Extract nutritional macro information from recipe scraper.
+# Separators splitting a dietary-restrictions string into individual entries,
+# compiled once instead of per call
+_DIETARY_SPLIT_RE = re.compile(r"[,;&|]")
+
+
+def extract_macros(nutrients: Optional[dict]) -> Optional[MacroNutrition]:
+    """Extract nutritional macro information from pre-fetched nutrients data.
 
     Uses the reusable extract_numeric_value utility to parse nutrition strings.
+    Accepts the nutrients dict directly so callers that already fetched
+    scraper.nutrients() (which reparses JSON-LD on every call) don't trigger
+    a second extraction.
 
     Args:
-        scraper (Any): Recipe scraper object from recipe-scrapers library.
+        nutrients (Optional[dict]): Nutrients mapping from scraper.nutrients().
 
     Returns:
         Optional[MacroNutrition]: Structured macro nutrition data, or None if unavailable.
     """
     try:
-        # Get nutrition data directly from recipe-scrapers
-        nutrients = scraper.nutrients()
         if not nutrients:
             return None
 
-        # Use utility to extract numbers from strings like "211 kcal", "13 g"
-        macros = MacroNutrition(
-            calories=extract_numeric_value_from_string(nutrients.get("calories")),
-            protein=extract_numeric_value_from_string(nutrients.get("proteinContent")),
-            carbohydrates=extract_numeric_value_from_string(
-                nutrients.get("carbohydrateContent")
-            ),
-            fat=extract_numeric_value_from_string(nutrients.get("fatContent")),
-            fiber=extract_numeric_value_from_string(nutrients.get("fiberContent")),
-            sugar=extract_numeric_value_from_string(nutrients.get("sugarContent")),
-            sodium=extract_numeric_value_from_string(nutrients.get("sodiumContent")),
-            saturated_fat=extract_numeric_value_from_string(
-                nutrients.get("saturatedFatContent")
-            ),
-            cholesterol=extract_numeric_value_from_string(
-                nutrients.get("cholesterolContent")
-            ),
-        )
+        # Use utility to extract numbers from strings like "211 kcal", "13 g",
+        # skipping fields that are absent so empty nutrition data short-circuits
+        parsed_values = {}
+        for field, nutrient_key in _NUTRIENT_KEYS.items():
+            raw_value = nutrients.get(nutrient_key)
+            if raw_value:
+                numeric_value = extract_numeric_value_from_string(raw_value)
+                if numeric_value is not None:
+                    parsed_values[field] = numeric_value
 
         # Return only if we got at least one value
-        if any(
-            getattr(macros, field) is not None for field in constants.MACROS_TO_EXTRACT
-        ):
+        if not parsed_values:
+            return None
+
+        macros = MacroNutrition(**parsed_values)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Macros extracted - Calories: {macros.calories}, Protein: {macros.protein}"
             )
-            return macros
-
-        return None
+        return macros
 
     except Exception as e:
         logger.error(f"Failed to extract macros - Error: {str(e)}")
@@ -89,7 +97,7 @@ def extract_dietary_restrictions(scraper: Any) -> List[str]:
         if isinstance(restrictions, str):
             restriction_list = [
                 restriction.strip().lower()
-                for restriction in re.split(r"[,;&|]", restrictions)
+                for restriction in _DIETARY_SPLIT_RE.split(restrictions)
                 if restriction.strip()
             ]
             return restriction_list
@@ -107,11 +115,14 @@ def extract_dietary_restrictions(scraper: Any) -> List[str]:
         return []
 
 
-def extract_tags(scraper: Any) -> List[str]:
+def extract_tags(scraper: Any, cuisine_type: Optional[str] = None) -> List[str]:
     """Extract tags from recipe-scrapers data.
 
     Args:
         scraper (Any): Recipe scraper object from recipe-scrapers library.
+        cuisine_type (Optional[str]): Pre-extracted cuisine value. Pass this
+            when the caller already extracted scraper.cuisine() to avoid a
+            second extraction.
 
     Returns:
         List[str]: List of tags extracted from category and cuisine fields,
@@ -124,8 +135,9 @@ def extract_tags(scraper: Any) -> List[str]:
     if recipe_category:
         extracted_tags.append(recipe_category)
 
-    # Extract from cuisine
-    cuisine_type = safely_extract_info_from_function_call(scraper.cuisine)
+    # Extract from cuisine (unless already extracted by the caller)
+    if cuisine_type is None:
+        cuisine_type = safely_extract_info_from_function_call(scraper.cuisine)
     if cuisine_type:
         extracted_tags.append(cuisine_type)
 
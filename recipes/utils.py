@@ -6,12 +6,47 @@ different recipe providers and services.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional, Any, Callable
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns for numeric and time extraction, compiled once at import instead
+# of going through the re module cache on every call
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_TIME_UNIT_RE = re.compile(r"(\d+)\s*([hm])?")
+_FIRST_INT_RE = re.compile(r"(\d+)")
+
+
+@lru_cache(maxsize=4096)
+def _extract_numeric_value_from_cached_string(value: str) -> Optional[float]:
+    """Cached numeric extraction for string inputs.
+
+    Nutrition strings like "211 kcal" or "13 g" repeat heavily across
+    recipes, so memoizing the regex parse turns duplicates into a dict
+    lookup. Only strings are cached; see extract_numeric_value_from_string
+    for the type-dispatching entry point.
+    """
+    # Nutrition strings nearly always lead with the number ("211 kcal"),
+    # so walk the leading digits/decimal point directly - a slice plus one
+    # float() call - and only involve the regex engine when the string
+    # doesn't start with an ASCII digit
+    if value and "0" <= value[0] <= "9":
+        index, length, seen_dot = 1, len(value), False
+        while index < length:
+            char = value[index]
+            if char == "." and not seen_dot:
+                seen_dot = True
+            elif not ("0" <= char <= "9"):
+                break
+            index += 1
+        return float(value[:index])
+
+    match = _NUMBER_RE.search(value)
+    return float(match.group(1)) if match else None
+
 
 def extract_numeric_value_from_string(value: Any) -> Optional[float]:
     """Extract numeric value from various data types and formats.
@@ -39,13 +74,19 @@ def extract_numeric_value_from_string(value: Any) -> Optional[float]:
         >>> extract_numeric_value_from_string("no numbers here")
         None
     """
-    if isinstance(value, (int, float)):
+    # Exact-type checks are two pointer compares and cover virtually every
+    # input; isinstance below keeps subclasses (e.g. bool) working
+    value_type = type(value)
+    if value_type is int or value_type is float:
         return float(value)
+    if value_type is str:
+        # Extract first decimal/integer number found (memoized per string)
+        return _extract_numeric_value_from_cached_string(value)
 
+    if isinstance(value, (int, float)):
+        return float(value)
     if isinstance(value, str):
-        # Extract first decimal/integer number found
-        match = re.search(r"(\d+(?:\.\d+)?)", value)
-        return float(match.group(1)) if match else None
+        return _extract_numeric_value_from_cached_string(value)
 
     return None
 
@@ -70,43 +111,60 @@ def safely_extract_info_from_function_call(
         extraction_result: Any = method()
         return extraction_result if extraction_result is not None else default_value
     except Exception as e:
+        # %-style args defer formatting to the logging framework, which
+        # skips it entirely when no handler wants the record
         logger.error(
-            f"Failed to extract data from method {method.__name__} with default value {default_value} and error {str(e)}",
+            "Failed to extract data from method %s with default value %r and error %s",
+            method.__name__,
+            default_value,
+            e,
         )
         return default_value
 
 
-def parse_time_string(time_str: Optional[str]) -> Optional[int]:
-    """Parse time strings (e.g., "30 minutes", "1 hour 15 min") to minutes.
-
-    Args:
-        time_str: Time string to parse.
+@lru_cache(maxsize=4096)
+def _parse_time_cached_string(time_str: str) -> Optional[int]:
+    """Cached time parsing for non-empty strings.
 
-    Returns:
-        Time in minutes, or None if parsing fails.
+    Scraped time fields repeat constantly ("30 minutes", "1 hour"), so
+    memoizing the parse turns duplicates into a dict lookup. The public
+    parse_time_string handles the None/empty cases before delegating.
     """
-    if not time_str:
-        return None
 
     # Common time patterns
     time_str = time_str.lower()
 
-    # Extract hours and minutes
-    hour_match = re.search(r"(\d+)\s*h(?:our)?s?", time_str)
-    minute_match = re.search(r"(\d+)\s*m(?:in)?(?:ute)?s?", time_str)
-
+    # Walk every number once and dispatch on the unit letter that follows
+    # it ("1 hour 15 min" -> h then m), instead of separate hour and
+    # minute regex passes over the same string
     total_minutes = 0
 
-    if hour_match:
-        total_minutes += int(hour_match.group(1)) * 60
-
-    if minute_match:
-        total_minutes += int(minute_match.group(1))
+    for unit_match in _TIME_UNIT_RE.finditer(time_str):
+        unit = unit_match.group(2)
+        if unit == "h":
+            total_minutes += int(unit_match.group(1)) * 60
+        elif unit == "m":
+            total_minutes += int(unit_match.group(1))
 
     # If no specific pattern found, try to extract just numbers
     if total_minutes == 0:
-        number_match = re.search(r"(\d+)", time_str)
+        number_match = _FIRST_INT_RE.search(time_str)
         if number_match:
             total_minutes = int(number_match.group(1))
 
     return total_minutes if total_minutes > 0 else None
+
+
+def parse_time_string(time_str: Optional[str]) -> Optional[int]:
+    """Parse time strings (e.g., "30 minutes", "1 hour 15 min") to minutes.
+
+    Args:
+        time_str: Time string to parse.
+
+    Returns:
+        Time in minutes, or None if parsing fails.
+    """
+    if not time_str:
+        return None
+
+    return _parse_time_cached_string(time_str)
@@ -1,9 +1,29 @@
+from functools import lru_cache
+
 from django.contrib import admin
+from django.db.models import Count, Q
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from .models import Plan, Subscription, Payment, SubscriptionFeature, PlanFeature
 
+# Constant status badges: no substitutions happen, so mark_safe once at
+# import beats running format_html's escaping machinery per row
+_ACTIVE_BADGE = mark_safe('<span style="color: green;">✓ Active</span>')
+_INACTIVE_BADGE = mark_safe('<span style="color: red;">✗ Inactive</span>')
+
+
+@lru_cache(maxsize=None)
+def _admin_change_url_template(url_name):
+    """Resolve an admin change URL once and turn it into a pk template.
+
+    reverse() walks the URL resolver on every call; link columns invoke it
+    per changelist row. Admin change URLs always embed the pk between
+    slashes (".../<pk>/change/"), so resolving with a dummy pk and
+    substituting per row is equivalent.
+    """
+    return reverse(url_name, args=[0]).replace('/0/', '/{}/')
+
 
 @admin.register(Plan)
 class PlanAdmin(admin.ModelAdmin):
@@ -50,10 +70,23 @@ class PlanAdmin(admin.ModelAdmin):
     price_display.short_description = 'Price'
     
     def subscriber_count(self, obj):
-        """Show number of active subscribers."""
-        count = obj.subscriptions.filter(status='active').count()
-        return count
+        """Show number of active subscribers (annotated in get_queryset)."""
+        return obj._subscriber_count
     subscriber_count.short_description = 'Active Subscribers'
+    subscriber_count.admin_order_field = '_subscriber_count'
+
+    def get_queryset(self, request):
+        """Annotate active-subscriber counts in one aggregated query.
+
+        The per-row obj.subscriptions.filter(...).count() issued one COUNT
+        query per plan on the changelist; the annotation folds them into
+        the list query and makes the column sortable.
+        """
+        return super().get_queryset(request).annotate(
+            _subscriber_count=Count(
+                'subscriptions', filter=Q(subscriptions__status='active')
+            )
+        )
 
 
 @admin.register(Subscription)
@@ -103,7 +136,9 @@ class SubscriptionAdmin(admin.ModelAdmin):
     def user_link(self, obj):
         """Link to user admin."""
         if obj.user:
-            url = reverse('admin:users_user_change', args=[obj.user.id])
+            url = _admin_change_url_template('admin:users_user_change').format(
+                obj.user.id
+            )
             return format_html('<a href="{}">{}</a>', url, obj.user.username)
         return '-'
     user_link.short_description = 'User'
@@ -117,19 +152,24 @@ class SubscriptionAdmin(admin.ModelAdmin):
     
     def is_active_display(self, obj):
         """Display active status with color."""
-        if obj.is_active:
-            return format_html(
-                '<span style="color: green;">✓ Active</span>'
-            )
-        else:
-            return format_html(
-                '<span style="color: red;">✗ Inactive</span>'
-            )
+        return _ACTIVE_BADGE if obj.is_active else _INACTIVE_BADGE
     is_active_display.short_description = 'Active'
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        return super().get_queryset(request).select_related('user', 'plan')
+        """Optimize queryset with select_related and column projection.
+
+        All local subscription fields stay loaded (the change form reads
+        them), but the joined user and plan rows are narrowed to the
+        columns the changelist and __str__ actually render.
+        """
+        return super().get_queryset(request).select_related('user', 'plan').only(
+            'user', 'plan', 'status', 'start_date', 'end_date', 'trial_end',
+            'canceled_at', 'current_period_start', 'current_period_end',
+            'cancel_at_period_end', 'external_subscription_id',
+            'external_customer_id', 'created_at', 'updated_at',
+            'user__id', 'user__username',
+            'plan__id', 'plan__name',
+        )
 
 
 @admin.register(Payment)
@@ -174,15 +214,19 @@ class PaymentAdmin(admin.ModelAdmin):
     def user_link(self, obj):
         """Link to user admin."""
         if obj.subscription.user:
-            url = reverse('admin:users_user_change', args=[obj.subscription.user.id])
+            url = _admin_change_url_template('admin:users_user_change').format(
+                obj.subscription.user.id
+            )
             return format_html('<a href="{}">{}</a>', url, obj.subscription.user.username)
         return '-'
     user_link.short_description = 'User'
     user_link.admin_order_field = 'subscription__user__username'
-    
+
     def subscription_link(self, obj):
         """Link to subscription admin."""
-        url = reverse('admin:subscriptions_subscription_change', args=[obj.subscription.id])
+        url = _admin_change_url_template(
+            'admin:subscriptions_subscription_change'
+        ).format(obj.subscription.id)
         return format_html('<a href="{}">{}</a>', url, obj.subscription)
     subscription_link.short_description = 'Subscription'
     
@@ -193,9 +237,21 @@ class PaymentAdmin(admin.ModelAdmin):
     amount_display.admin_order_field = 'amount'
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related."""
+        """Optimize queryset with select_related and column projection.
+
+        Local payment fields stay loaded for the change form; the joined
+        subscription/user/plan rows are narrowed to what the changelist
+        links and __str__ render.
+        """
         return super().get_queryset(request).select_related(
             'subscription__user', 'subscription__plan'
+        ).only(
+            'subscription', 'amount', 'currency', 'status', 'paid_at',
+            'external_payment_id', 'external_invoice_id', 'description',
+            'metadata', 'created_at', 'updated_at',
+            'subscription__id', 'subscription__status',
+            'subscription__user__id', 'subscription__user__username',
+            'subscription__plan__id', 'subscription__plan__name',
         )
 
 
@@ -1,7 +1,9 @@
 from ninja import Router, Schema
 from ninja.errors import HttpError
+from django.db import IntegrityError
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from collections import defaultdict
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -11,6 +13,15 @@ from core.logger import log_info, log_error
 
 router = Router()
 
+# Billing-cycle length as ready-made timedeltas; unknown cycles fall back
+# to yearly, matching the else branch this table replaces. Building the
+# deltas once at import skips a timedelta construction per subscription.
+_CYCLE_DELTA = {
+    'monthly': timedelta(days=30),
+    'quarterly': timedelta(days=90),
+    'yearly': timedelta(days=365),
+}
+
 
 # Schema definitions
 class PlanSchema(Schema):
@@ -77,12 +88,14 @@ class SubscriptionStatusSchema(Schema):
 def list_plans(request):
     """Get all active subscription plans."""
     try:
-        plans = PlanSelector.get_active_plans()
-        
+        # Materialized list: the serializer iterates the result anyway, and
+        # len() on the list avoids the extra SELECT COUNT(*) round-trip
+        plans = PlanSelector.get_active_plans_cached()
+
         log_info(
             "Plans requested",
             user_id=getattr(request.user, 'id', None),
-            plans_count=plans.count()
+            plans_count=len(plans)
         )
         
         return plans
@@ -121,13 +134,15 @@ def list_user_subscriptions(request):
         raise HttpError(401, "Authentication required")
     
     try:
-        subscriptions = SubscriptionSelector.get_user_subscriptions(request.user)
-        
+        subscriptions = list(
+            SubscriptionSelector.get_user_subscriptions(request.user)
+        )
+
         log_info(
             "User subscriptions requested",
             user_id=request.user.id,
             username=request.user.username,
-            subscriptions_count=subscriptions.count()
+            subscriptions_count=len(subscriptions)
         )
         
         return subscriptions
@@ -179,7 +194,9 @@ def create_subscription(request, data: CreateSubscriptionSchema):
         raise HttpError(401, "Authentication required")
     
     try:
-        # Check if user already has an active subscription
+        # Check if user already has an active subscription. The selector
+        # runs an .exists() probe (SELECT 1 ... LIMIT 1) — keep it that way
+        # rather than fetching a row just to test for one
         if SubscriptionSelector.check_user_has_active_subscription(request.user):
             raise HttpError(400, "User already has an active subscription")
         
@@ -199,25 +216,28 @@ def create_subscription(request, data: CreateSubscriptionSchema):
             status = 'active'
         
         # Calculate billing period
-        if plan.billing_cycle == 'monthly':
-            period_end = now + timedelta(days=30)
-        elif plan.billing_cycle == 'quarterly':
-            period_end = now + timedelta(days=90)
-        else:  # yearly
-            period_end = now + timedelta(days=365)
-        
-        # Create subscription
-        subscription = Subscription.objects.create(
-            user=request.user,
-            plan=plan,
-            status=status,
-            start_date=start_date,
-            trial_end=trial_end,
-            current_period_start=start_date,
-            current_period_end=period_end,
-            external_customer_id=getattr(request.user, 'external_customer_id', None)
+        period_end = now + _CYCLE_DELTA.get(
+            plan.billing_cycle, _CYCLE_DELTA['yearly']
         )
         
+        # Create subscription. The uniq_active_sub_per_user constraint
+        # backstops the .exists() pre-check: a concurrent duplicate raises
+        # IntegrityError, which must map to the same 400 as the pre-check
+        # rather than fall into the generic 500 handler below
+        try:
+            subscription = Subscription.objects.create(
+                user=request.user,
+                plan=plan,
+                status=status,
+                start_date=start_date,
+                trial_end=trial_end,
+                current_period_start=start_date,
+                current_period_end=period_end,
+                external_customer_id=getattr(request.user, 'external_customer_id', None)
+            )
+        except IntegrityError:
+            raise HttpError(400, "User already has an active subscription")
+        
         log_info(
             "Subscription created",
             user_id=request.user.id,
@@ -248,8 +268,10 @@ def cancel_subscription(request, subscription_id: int, data: CancelSubscriptionS
         raise HttpError(401, "Authentication required")
     
     try:
+        # Only the status check reads the row here; cancel() un-defers the
+        # fields it assigns before saving, so the narrow fetch stays safe
         subscription = get_object_or_404(
-            Subscription,
+            Subscription.objects.only('id', 'status', 'cancel_at_period_end'),
             id=subscription_id,
             user=request.user
         )
@@ -288,13 +310,13 @@ def list_payments(request):
         raise HttpError(401, "Authentication required")
     
     try:
-        payments = PaymentSelector.get_user_payments(request.user)
-        
+        payments = list(PaymentSelector.get_user_payments(request.user))
+
         log_info(
             "Payment history requested",
             user_id=request.user.id,
             username=request.user.username,
-            payments_count=payments.count()
+            payments_count=len(payments)
         )
         
         return payments
@@ -317,8 +339,8 @@ def get_subscription_status(request):
         # Get current subscription
         current_subscription = SubscriptionSelector.get_user_active_subscription(request.user)
         
-        # Get available plans
-        available_plans = PlanSelector.get_active_plans()
+        # Get available plans (shared 60s cache with list_plans)
+        available_plans = PlanSelector.get_active_plans_cached()
         
         log_info(
             "Subscription status requested",
@@ -346,13 +368,13 @@ def get_subscription_status(request):
 def list_features(request):
     """Get all available subscription features."""
     try:
-        features = FeatureSelector.get_all_features()
-        
-        # Group features by category
-        features_by_category = {}
+        features = list(FeatureSelector.get_all_features())
+
+        # Group features by category; defaultdict drops the per-row
+        # membership check and double lookup (the selector already orders
+        # by category, so grouping is a straight append)
+        features_by_category = defaultdict(list)
         for feature in features:
-            if feature.category not in features_by_category:
-                features_by_category[feature.category] = []
             features_by_category[feature.category].append({
                 "id": feature.pk,
                 "name": feature.name,
@@ -365,7 +387,7 @@ def list_features(request):
         log_info(
             "Features requested",
             user_id=getattr(request.user, 'id', None),
-            features_count=features.count()
+            features_count=len(features)
         )
         
         return features_by_category
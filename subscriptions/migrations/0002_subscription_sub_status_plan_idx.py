@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(
+                fields=["status", "plan"], name="sub_status_plan_idx"
+            ),
+        ),
+    ]
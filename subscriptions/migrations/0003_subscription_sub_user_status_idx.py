@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0002_subscription_sub_status_plan_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(
+                fields=["user", "status"],
+                include=["plan", "current_period_end"],
+                name="sub_user_status_idx",
+            ),
+        ),
+    ]
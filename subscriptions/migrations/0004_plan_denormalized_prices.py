@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+
+def backfill_derived_prices(apps, schema_editor):
+    Plan = apps.get_model("subscriptions", "Plan")
+    plans = []
+    for plan in Plan.objects.all():
+        if plan.billing_cycle == "yearly":
+            plan._yearly_price = plan.price
+            plan._monthly_equivalent_price = plan.price / 12
+        elif plan.billing_cycle == "quarterly":
+            plan._yearly_price = plan.price * 4
+            plan._monthly_equivalent_price = plan.price / 3
+        else:  # monthly
+            plan._yearly_price = plan.price * 12
+            plan._monthly_equivalent_price = plan.price
+        plans.append(plan)
+    Plan.objects.bulk_update(
+        plans, ["_yearly_price", "_monthly_equivalent_price"]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0003_subscription_sub_user_status_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plan",
+            name="_yearly_price",
+            field=models.DecimalField(
+                decimal_places=2,
+                editable=False,
+                help_text="Stored yearly price, derived from price and billing cycle",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="plan",
+            name="_monthly_equivalent_price",
+            field=models.DecimalField(
+                decimal_places=2,
+                editable=False,
+                help_text="Stored monthly-equivalent price, derived from price and billing cycle",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            backfill_derived_prices, migrations.RunPython.noop
+        ),
+    ]
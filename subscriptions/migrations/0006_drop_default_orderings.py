@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0005_payment_pay_status_created_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="subscription",
+            options={
+                "verbose_name": "Subscription",
+                "verbose_name_plural": "Subscriptions",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="payment",
+            options={
+                "verbose_name": "Payment",
+                "verbose_name_plural": "Payments",
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0006_drop_default_orderings"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="subscription",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status__in", ("active", "trialing"))),
+                fields=("user",),
+                name="uniq_active_sub_per_user",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("subscriptions", "0007_uniq_active_sub_per_user"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plan",
+            name="yearly_savings",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.F("_monthly_equivalent_price") * 12
+                - models.F("_yearly_price"),
+                help_text="Yearly savings versus paying the monthly equivalent, maintained by the database",
+                output_field=models.DecimalField(decimal_places=2, max_digits=10),
+            ),
+        ),
+    ]
@@ -1,9 +1,20 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 from core.base_models import TimeStampedModel
 
+# Cache key for the active-plan catalog (see subscriptions.api); any Plan
+# write invalidates it so cached reads never serve a stale catalog past
+# the write
+ACTIVE_PLANS_CACHE_KEY = "subscriptions:active_plans:v1"
+
+# Statuses under which a subscription grants access; shared by the model
+# property and every status__in selector filter so the two can't drift
+ACTIVE_SUBSCRIPTION_STATUSES = ("active", "trialing")
+
 
 class Plan(TimeStampedModel):
     """
@@ -78,6 +89,31 @@ class Plan(TimeStampedModel):
         help_text="Number of free trial days",
     )
 
+    # Denormalized price conversions, recomputed in save(); catalog views
+    # read these per plan per pageview, so they are stored rather than
+    # derived on every access
+    _yearly_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Stored yearly price, derived from price and billing cycle",
+    )
+    _monthly_equivalent_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        editable=False,
+        help_text="Stored monthly-equivalent price, derived from price and billing cycle",
+    )
+    yearly_savings = models.GeneratedField(
+        expression=models.F("_monthly_equivalent_price") * 12
+        - models.F("_yearly_price"),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        help_text="Yearly savings versus paying the monthly equivalent, maintained by the database",
+    )
+
     class Meta:
         db_table = "subscription_plans"
         ordering = ["price"]
@@ -88,13 +124,36 @@ class Plan(TimeStampedModel):
         return f"{self.name} - ${self.price}/{self.billing_cycle}"
 
     def save(self, *args, **kwargs):
-        """Override save to add logging."""
+        """Override save to refresh derived prices and invalidate the catalog cache."""
+
+        self._yearly_price = self._compute_yearly_price()
+        self._monthly_equivalent_price = self._compute_monthly_equivalent_price()
+
+        # Targeted saves touching the inputs must also persist the derived
+        # columns, or the row (and the DB-generated yearly_savings with it)
+        # keeps stale prices
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"price", "billing_cycle"}.isdisjoint(
+            update_fields
+        ):
+            kwargs["update_fields"] = [
+                *update_fields,
+                "_yearly_price",
+                "_monthly_equivalent_price",
+            ]
 
         super().save(*args, **kwargs)
+        cache.delete(ACTIVE_PLANS_CACHE_KEY)
 
-    @property
-    def yearly_price(self):
-        """Calculate yearly price based on billing cycle."""
+    def delete(self, *args, **kwargs):
+        """Override delete to invalidate the cached plan catalog."""
+
+        result = super().delete(*args, **kwargs)
+        cache.delete(ACTIVE_PLANS_CACHE_KEY)
+        return result
+
+    def _compute_yearly_price(self):
+        """Derive the yearly price from the billing cycle."""
         if self.billing_cycle == "yearly":
             return self.price
         elif self.billing_cycle == "quarterly":
@@ -102,9 +161,8 @@ class Plan(TimeStampedModel):
         else:  # monthly
             return self.price * 12
 
-    @property
-    def monthly_equivalent_price(self):
-        """Calculate monthly equivalent price."""
+    def _compute_monthly_equivalent_price(self):
+        """Derive the monthly-equivalent price from the billing cycle."""
         if self.billing_cycle == "monthly":
             return self.price
         elif self.billing_cycle == "quarterly":
@@ -112,6 +170,20 @@ class Plan(TimeStampedModel):
         else:  # yearly
             return self.price / 12
 
+    @property
+    def yearly_price(self):
+        """Yearly price, read from the stored column when available."""
+        if self._yearly_price is not None:
+            return self._yearly_price
+        return self._compute_yearly_price()
+
+    @property
+    def monthly_equivalent_price(self):
+        """Monthly equivalent price, read from the stored column when available."""
+        if self._monthly_equivalent_price is not None:
+            return self._monthly_equivalent_price
+        return self._compute_monthly_equivalent_price()
+
 
 class Subscription(TimeStampedModel):
     """
@@ -184,35 +256,62 @@ class Subscription(TimeStampedModel):
 
     class Meta:
         db_table = "subscriptions"
-        ordering = ["-created_at"]
         verbose_name = "Subscription"
         verbose_name_plural = "Subscriptions"
+        indexes = [
+            # Serves the status-filtered per-plan analytics group-by as an
+            # index-only scan
+            models.Index(fields=["status", "plan"], name="sub_status_plan_idx"),
+            # Covers the per-request active-subscription lookups: the
+            # included columns let Postgres answer without touching the heap
+            models.Index(
+                fields=["user", "status"],
+                name="sub_user_status_idx",
+                include=["plan", "current_period_end"],
+            ),
+        ]
+        constraints = [
+            # One access-granting subscription per user, enforced in the
+            # database so concurrent create requests can't both slip past
+            # the application-level check
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(status__in=ACTIVE_SUBSCRIPTION_STATUSES),
+                name="uniq_active_sub_per_user",
+            ),
+        ]
+
+    # frozenset gives the is_active check a hash probe instead of building
+    # and scanning a list per call, which adds up across list renderings
+    _ACTIVE_STATUSES = frozenset(ACTIVE_SUBSCRIPTION_STATUSES)
 
     def __str__(self):
         return f"{self.user.username} - {self.plan.name} ({self.status})"
 
-    def save(self, *args, **kwargs):
-        """Override save to add logging."""
-        super().save(*args, **kwargs)
-
     @property
     def is_active(self):
         """Check if subscription is currently active."""
-        return self.status in ["active", "trialing"]
+        return self.status in self._ACTIVE_STATUSES
 
     @property
     def is_trialing(self):
         """Check if subscription is in trial period."""
+        # Prefer the value annotated by the listing selectors, which is
+        # computed in the database during the fetch
+        annotated = getattr(self, "_is_trialing", None)
+        if annotated is not None:
+            return annotated
+
         if not self.trial_end:
             return False
-        from django.utils import timezone
-
         return timezone.now() < self.trial_end
 
     @property
     def days_remaining(self):
         """Calculate days remaining in current period."""
-        from django.utils import timezone
+        annotated = getattr(self, "_days_remaining", None)
+        if annotated is not None:
+            return max(annotated, 0)
 
         now = timezone.now()
         if self.current_period_end > now:
@@ -221,17 +320,18 @@ class Subscription(TimeStampedModel):
 
     def cancel(self, at_period_end=True):
         """Cancel the subscription."""
-        from django.utils import timezone
-
+        # update_fields keeps the UPDATE to the columns actually touched
+        # instead of rewriting the whole row; updated_at rides along so
+        # auto_now still persists
         if at_period_end:
             self.cancel_at_period_end = True
             self.status = "active"  # Keep active until period ends
+            self.save(update_fields=["cancel_at_period_end", "status", "updated_at"])
         else:
             self.status = "canceled"
             self.canceled_at = timezone.now()
             self.end_date = timezone.now()
-
-        self.save()
+            self.save(update_fields=["status", "canceled_at", "end_date", "updated_at"])
 
 
 class Payment(TimeStampedModel):
@@ -301,36 +401,19 @@ class Payment(TimeStampedModel):
 
     class Meta:
         db_table = "subscription_payments"
-        ordering = ["-created_at"]
         verbose_name = "Payment"
         verbose_name_plural = "Payments"
+        indexes = [
+            # Turns the revenue-by-period aggregation (status = 'succeeded'
+            # AND created_at range) into an index range scan
+            models.Index(
+                fields=["status", "created_at"], name="pay_status_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.subscription.user.username} - ${self.amount} ({self.status})"
 
-    def save(self, *args, **kwargs):
-        """Override save to add logging."""
-        is_new = self.pk is None
-
-        if is_new:
-            log_info(
-                "Creating new payment",
-                user_id=self.subscription.user.id,
-                username=self.subscription.user.username,
-                amount=self.amount,
-                status=self.status,
-            )
-        else:
-            log_info(
-                "Updating payment",
-                user_id=self.subscription.user.id,
-                username=self.subscription.user.username,
-                amount=self.amount,
-                status=self.status,
-            )
-
-        super().save(*args, **kwargs)
-
 
 class SubscriptionFeature(TimeStampedModel):
     """
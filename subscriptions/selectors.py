@@ -1,31 +1,98 @@
-from django.db.models import Prefetch, Count, Sum
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import (
+    Avg,
+    BooleanField,
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Prefetch,
+    Q,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import ExtractDay, Now
+from django.utils import timezone
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from .models import Plan, Subscription, Payment, SubscriptionFeature, PlanFeature
+from .models import (
+    ACTIVE_PLANS_CACHE_KEY,
+    ACTIVE_SUBSCRIPTION_STATUSES,
+    Plan,
+    Subscription,
+    Payment,
+    SubscriptionFeature,
+    PlanFeature,
+)
+
+# Shared prefetch descriptor for plan features with their feature rows
+# attached; queryset evaluation is deferred, so building it once at import
+# lets every plan selector reuse the same prefetch metadata
+_PLAN_FEATURES_PREFETCH = Prefetch(
+    'plan_features',
+    queryset=PlanFeature.objects.select_related('feature')
+)
 
 
 class PlanSelector:
     """Database queries for Plan model."""
-    
+
     @staticmethod
-    def get_active_plans():
+    def get_active_plans(with_features: bool = False):
         """Get all active subscription plans.
-        
+
+        Args:
+            with_features: Prefetch plan features (with their feature rows)
+                so callers rendering feature lists avoid N+1 queries.
+
         Returns:
             QuerySet: All active plans ordered by price.
         """
-        return Plan.objects.filter(is_active=True).order_by('price')
-    
+        queryset = Plan.objects.filter(is_active=True).order_by('price')
+        if with_features:
+            queryset = queryset.prefetch_related(_PLAN_FEATURES_PREFETCH)
+        return queryset
+
     @staticmethod
-    def get_popular_plans():
+    def get_popular_plans(with_features: bool = False):
         """Get popular/recommended plans.
-        
+
+        Args:
+            with_features: Prefetch plan features (with their feature rows)
+                so callers rendering feature lists avoid N+1 queries.
+
         Returns:
             QuerySet: All active and popular plans ordered by price.
         """
-        return Plan.objects.filter(is_active=True, is_popular=True).order_by('price')
+        queryset = Plan.objects.filter(
+            is_active=True, is_popular=True
+        ).order_by('price')
+        if with_features:
+            queryset = queryset.prefetch_related(_PLAN_FEATURES_PREFETCH)
+        return queryset
     
+    @staticmethod
+    def get_active_plans_cached() -> List[Plan]:
+        """Get the active-plan catalog as a cached, materialized list.
+
+        Plans change rarely but the catalog is read on nearly every
+        plans/status request; the 60-second TTL keeps those reads off the
+        database and Plan.save()/delete() drop the key immediately, so a
+        stale catalog is never served past a write.
+
+        Returns:
+            list[Plan]: All active plans ordered by price.
+        """
+        plans = cache.get(ACTIVE_PLANS_CACHE_KEY)
+        if plans is None:
+            plans = list(PlanSelector.get_active_plans())
+            cache.set(ACTIVE_PLANS_CACHE_KEY, plans, 60)
+        return plans
+
     @staticmethod
     def get_plan_by_id(plan_id: int) -> Optional[Plan]:
         """Get a plan by ID.
@@ -36,7 +103,12 @@ class PlanSelector:
         Returns:
             Plan or None: The plan if found and active, None otherwise.
         """
-        return Plan.objects.filter(id=plan_id, is_active=True).first()
+        # Resolved from the cached catalog like get_plan_by_slug, so
+        # repeated lookups within a request never reach the database
+        for plan in PlanSelector.get_active_plans_cached():
+            if plan.id == plan_id:
+                return plan
+        return None
     
     @staticmethod
     def get_plan_by_slug(slug: str) -> Optional[Plan]:
@@ -48,7 +120,12 @@ class PlanSelector:
         Returns:
             Plan or None: The plan if found and active, None otherwise.
         """
-        return Plan.objects.filter(slug=slug, is_active=True).first()
+        # The cached catalog holds every active plan, so slug lookup is an
+        # in-process scan of a handful of rows instead of a query
+        for plan in PlanSelector.get_active_plans_cached():
+            if plan.slug == slug:
+                return plan
+        return None
     
     @staticmethod
     def get_plan_with_features(plan_id: int) -> Optional[Plan]:
@@ -61,14 +138,9 @@ class PlanSelector:
             Plan or None: The plan with prefetched features if found and active, None otherwise.
         """
         return Plan.objects.filter(
-            id=plan_id, 
+            id=plan_id,
             is_active=True
-        ).prefetch_related(
-            Prefetch(
-                'plan_features',
-                queryset=PlanFeature.objects.select_related('feature')
-            )
-        ).first()
+        ).prefetch_related(_PLAN_FEATURES_PREFETCH).first()
 
 
 class SubscriptionSelector:
@@ -84,9 +156,31 @@ class SubscriptionSelector:
         Returns:
             QuerySet: All subscriptions for the user ordered by creation date (newest first).
         """
-        return Subscription.objects.filter(
+        # Annotations compute the trial flag and remaining days in the
+        # listing query itself; the model properties read them instead of
+        # doing per-row timezone.now() and datetime arithmetic in Python
+        queryset = Subscription.objects.filter(
             user=user
-        ).select_related('plan').order_by('-created_at')
+        ).select_related('plan').annotate(
+            _is_trialing=Case(
+                When(trial_end__gt=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+        # ExtractDay over a duration needs native interval support
+        # (Postgres); on SQLite the days_remaining property falls back to
+        # its Python arithmetic
+        if connection.features.has_native_duration_field:
+            queryset = queryset.annotate(
+                _days_remaining=ExtractDay(
+                    ExpressionWrapper(
+                        F('current_period_end') - Now(),
+                        output_field=DurationField(),
+                    )
+                ),
+            )
+        return queryset.order_by('-created_at')
     
     @staticmethod
     def get_user_active_subscription(user) -> Optional[Subscription]:
@@ -100,7 +194,7 @@ class SubscriptionSelector:
         """
         return Subscription.objects.filter(
             user=user,
-            status__in=['active', 'trialing']
+            status__in=ACTIVE_SUBSCRIPTION_STATUSES
         ).select_related('plan').first()
     
     @staticmethod
@@ -129,34 +223,57 @@ class SubscriptionSelector:
         Returns:
             Subscription or None: The subscription if found, None otherwise.
         """
-        return Subscription.objects.filter(
-            external_subscription_id=external_id
-        ).select_related('plan', 'user').first()
+        # The column is nullable-unique, so many NULL rows can coexist; a
+        # missing id in a webhook payload must not turn into
+        # MultipleObjectsReturned
+        if external_id is None:
+            return None
+        # external_subscription_id is unique, so .get() probes the unique
+        # index directly without the ORDER BY pk LIMIT 1 that first() adds
+        try:
+            return Subscription.objects.select_related('plan', 'user').get(
+                external_subscription_id=external_id
+            )
+        except Subscription.DoesNotExist:
+            return None
     
     @staticmethod
-    def get_active_subscriptions():
+    def get_active_subscriptions(iterator: bool = False):
         """Get all active subscriptions across all users.
-        
+
+        Args:
+            iterator: Stream results in chunks of 2000 via a server-side
+                cursor instead of materializing every row. Use for
+                single-pass admin/analytics sweeps over large result sets.
+
         Returns:
             QuerySet: All active and trialing subscriptions with related data.
         """
-        return Subscription.objects.filter(
-            status__in=['active', 'trialing']
+        queryset = Subscription.objects.filter(
+            status__in=ACTIVE_SUBSCRIPTION_STATUSES
         ).select_related('plan', 'user')
-    
+        if iterator:
+            return queryset.iterator(chunk_size=2000)
+        return queryset
+
     @staticmethod
-    def get_subscriptions_by_plan(plan_id: int):
+    def get_subscriptions_by_plan(plan_id: int, iterator: bool = False):
         """Get all subscriptions for a specific plan.
-        
+
         Args:
             plan_id: The ID of the plan.
-            
+            iterator: Stream results in chunks of 2000 instead of
+                materializing every row; see get_active_subscriptions.
+
         Returns:
             QuerySet: All subscriptions for the specified plan with related data.
         """
-        return Subscription.objects.filter(
+        queryset = Subscription.objects.filter(
             plan_id=plan_id
         ).select_related('plan', 'user')
+        if iterator:
+            return queryset.iterator(chunk_size=2000)
+        return queryset
     
     @staticmethod
     def get_expiring_subscriptions(days: int = 7):
@@ -168,12 +285,9 @@ class SubscriptionSelector:
         Returns:
             QuerySet: Subscriptions expiring within the specified days.
         """
-        from django.utils import timezone
-        from datetime import timedelta
-        
         expiry_date = timezone.now() + timedelta(days=days)
         return Subscription.objects.filter(
-            status__in=['active', 'trialing'],
+            status__in=ACTIVE_SUBSCRIPTION_STATUSES,
             current_period_end__lte=expiry_date
         ).select_related('plan', 'user')
     
@@ -184,8 +298,6 @@ class SubscriptionSelector:
         Returns:
             QuerySet: All trialing subscriptions that haven't ended yet.
         """
-        from django.utils import timezone
-        
         return Subscription.objects.filter(
             status='trialing',
             trial_end__gt=timezone.now()
@@ -223,10 +335,12 @@ class SubscriptionSelector:
         Returns:
             bool: True if user has an active subscription, False otherwise.
         """
+        # values('pk') keeps the EXISTS probe to a single column, so the
+        # (user, status) covering index answers it without a heap fetch
         return Subscription.objects.filter(
             user=user,
-            status__in=['active', 'trialing']
-        ).exists()
+            status__in=ACTIVE_SUBSCRIPTION_STATUSES
+        ).values('pk').exists()
     
     @staticmethod
     def get_user_subscription_by_plan(user, plan_id: int) -> Optional[Subscription]:
@@ -249,18 +363,24 @@ class PaymentSelector:
     """Database queries for Payment model."""
     
     @staticmethod
-    def get_user_payments(user):
+    def get_user_payments(user, include_metadata: bool = False):
         """Get all payments for a user.
-        
+
         Args:
             user: The user whose payments to retrieve.
-            
+            include_metadata: Load the metadata JSON column as well. It can
+                be multi-KB per row and listing views never render it, so
+                it stays deferred by default.
+
         Returns:
             QuerySet: All payments for the user ordered by creation date (newest first).
         """
-        return Payment.objects.filter(
+        queryset = Payment.objects.filter(
             subscription__user=user
         ).select_related('subscription__plan').order_by('-created_at')
+        if not include_metadata:
+            queryset = queryset.defer('metadata')
+        return queryset
     
     @staticmethod
     def get_subscription_payments(subscription_id: int):
@@ -300,9 +420,17 @@ class PaymentSelector:
         Returns:
             Payment or None: The payment if found, None otherwise.
         """
-        return Payment.objects.filter(
-            external_payment_id=external_id
-        ).select_related('subscription__plan', 'subscription__user').first()
+        # Nullable-unique column: bail on None before it can match the
+        # many NULL rows
+        if external_id is None:
+            return None
+        # external_payment_id is unique; see get_subscription_by_external_id
+        try:
+            return Payment.objects.select_related(
+                'subscription__plan', 'subscription__user'
+            ).get(external_payment_id=external_id)
+        except Payment.DoesNotExist:
+            return None
     
     @staticmethod
     def get_successful_payments():
@@ -327,19 +455,27 @@ class PaymentSelector:
         ).select_related('subscription__plan', 'subscription__user')
     
     @staticmethod
-    def get_payments_by_date_range(start_date: datetime, end_date: datetime):
+    def get_payments_by_date_range(
+        start_date: datetime, end_date: datetime, iterator: bool = False
+    ):
         """Get payments within a date range.
-        
+
         Args:
             start_date: Start of the date range.
             end_date: End of the date range.
-            
+            iterator: Stream results in chunks of 2000 instead of
+                materializing every row; use for single-pass reporting
+                sweeps over wide date ranges.
+
         Returns:
             QuerySet: All payments created within the specified date range.
         """
-        return Payment.objects.filter(
+        queryset = Payment.objects.filter(
             created_at__range=(start_date, end_date)
         ).select_related('subscription__plan', 'subscription__user')
+        if iterator:
+            return queryset.iterator(chunk_size=2000)
+        return queryset
 
 
 class FeatureSelector:
@@ -421,14 +557,41 @@ class SubscriptionAnalyticsSelector:
         Returns:
             dict: Dictionary mapping plan names to subscription counts.
         """
-        return dict(
-            Subscription.objects.filter(
-                status__in=['active', 'trialing']
-            ).values('plan__name').annotate(
-                count=Count('id')
-            ).values_list('plan__name', 'count')
-        )
+        # Single values_list projection (the old values/values_list pair
+        # rebuilt the SELECT list); the (status, plan) index covers the
+        # filtered group-by
+        counts = Subscription.objects.filter(
+            status__in=ACTIVE_SUBSCRIPTION_STATUSES
+        ).values_list('plan__name').annotate(count=Count('id'))
+        return {plan_name: count for plan_name, count in counts}
     
+    @staticmethod
+    def get_plan_dashboard() -> List[dict]:
+        """Get per-plan subscription counts for dashboard views in one query.
+
+        Combines what get_subscription_count_by_plan and
+        get_plan_popularity_stats each compute with their own scan of the
+        subscriptions table; dashboards needing both should call this
+        instead and read one join + group-by.
+
+        Returns:
+            List[dict]: Per-plan dicts with name, price, active_count and
+                total_count, most subscribed first.
+        """
+        return list(
+            Plan.objects.filter(is_active=True).annotate(
+                active_count=Count(
+                    'subscriptions',
+                    filter=Q(
+                        subscriptions__status__in=ACTIVE_SUBSCRIPTION_STATUSES
+                    ),
+                ),
+                total_count=Count('subscriptions'),
+            ).values(
+                'name', 'price', 'active_count', 'total_count'
+            ).order_by('-active_count')
+        )
+
     @staticmethod
     def get_revenue_by_period(start_date: datetime, end_date: datetime) -> dict:
         """Get revenue data for a specific period.
@@ -458,24 +621,28 @@ class SubscriptionAnalyticsSelector:
         Returns:
             dict: Dictionary containing subscription and payment statistics.
         """
-        subscriptions = Subscription.objects.filter(user=user)
-        
+        # Conditional aggregation folds the three subscription counts into
+        # one query and the payment count/sum into another: two round-trips
+        # and one scan per table instead of five separate COUNT/SUM queries
+        subscription_stats = Subscription.objects.filter(user=user).aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status__in=ACTIVE_SUBSCRIPTION_STATUSES)),
+            canceled=Count('id', filter=Q(status='canceled')),
+        )
+        payment_stats = Payment.objects.filter(
+            subscription__user=user,
+            status='succeeded'
+        ).aggregate(
+            count=Count('id'),
+            total=Sum('amount'),
+        )
+
         return {
-            'total_subscriptions': subscriptions.count(),
-            'active_subscriptions': subscriptions.filter(
-                status__in=['active', 'trialing']
-            ).count(),
-            'canceled_subscriptions': subscriptions.filter(
-                status='canceled'
-            ).count(),
-            'total_payments': Payment.objects.filter(
-                subscription__user=user,
-                status='succeeded'
-            ).count(),
-            'total_spent': Payment.objects.filter(
-                subscription__user=user,
-                status='succeeded'
-            ).aggregate(total=Sum('amount'))['total'] or 0
+            'total_subscriptions': subscription_stats['total'],
+            'active_subscriptions': subscription_stats['active'],
+            'canceled_subscriptions': subscription_stats['canceled'],
+            'total_payments': payment_stats['count'],
+            'total_spent': payment_stats['total'] or 0
         }
     
     @staticmethod
@@ -485,11 +652,21 @@ class SubscriptionAnalyticsSelector:
         Returns:
             List[dict]: List of dictionaries containing plan popularity data.
         """
+        # The old avg_subscription_duration was a Count over the same
+        # joined rows as subscription_count — a duplicate column under a
+        # misleading name. Average the actual period interval instead,
+        # still in the same scan.
         return list(
             Plan.objects.filter(is_active=True).annotate(
                 subscription_count=Count('subscriptions'),
-                avg_subscription_duration=Count('subscriptions__current_period_end')
+                avg_duration=Avg(
+                    ExpressionWrapper(
+                        F('subscriptions__current_period_end')
+                        - F('subscriptions__current_period_start'),
+                        output_field=DurationField(),
+                    )
+                ),
             ).values(
-                'name', 'price', 'subscription_count'
+                'name', 'price', 'subscription_count', 'avg_duration'
             ).order_by('-subscription_count')
-        ) 
\ No newline at end of file
+        )
\ No newline at end of file
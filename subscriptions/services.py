@@ -1,5 +1,5 @@
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from datetime import timedelta
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
@@ -9,8 +9,46 @@ from .models import Plan, Subscription, Payment
 from core.logger import log_info
 
 
+# Access decision per feature type, keyed for single-lookup dispatch in
+# check_feature_access; numeric features are simplified to always-on until
+# usage tracking exists
+_FEATURE_TYPE_HANDLERS = {
+    'boolean': lambda value: value.get('enabled', False),
+    'numeric': lambda value: True,
+    'unlimited': lambda value: True,
+}
+
+
+def _get_active_subscription_cached(user):
+    """Fetch the user's active subscription once per user instance.
+
+    Views commonly build the status dict and then check limits or feature
+    access in the same request, each of which needs the active
+    subscription. Stashing the result on the user object (False marks
+    "looked up, none found") collapses those into one query; the cache
+    dies with the user instance at the end of the request.
+    """
+    cached = getattr(user, "_active_subscription_cache", None)
+    if cached is None:
+        cached = SubscriptionSelector.get_user_active_subscription(user) or False
+        if cached:
+            # Seed the FK cache with the user we already hold so later
+            # subscription.user access (log lines, __str__) never queries
+            cached.user = user
+        user._active_subscription_cache = cached
+    return cached or None
+
+
 class SubscriptionService:
     """Service class for subscription-related business logic."""
+
+    # Billing-period length per cycle as ready-made timedeltas; unknown
+    # cycles fall back to yearly, matching the old else branch
+    _PERIOD_DELTAS = {
+        'monthly': timedelta(days=30),
+        'quarterly': timedelta(days=90),
+        'yearly': timedelta(days=365),
+    }
     
     @staticmethod
     def create_subscription(user, plan: Plan, external_customer_id: Optional[str] = None) -> Subscription:
@@ -26,10 +64,6 @@ class SubscriptionService:
             Created Subscription instance
         """
         with transaction.atomic():
-            # Check if user already has an active subscription
-            if SubscriptionSelector.check_user_has_active_subscription(user):
-                raise ValueError("User already has an active subscription")
-            
             # Calculate dates
             now = timezone.now()
             start_date = now
@@ -45,18 +79,23 @@ class SubscriptionService:
             # Calculate billing period
             period_end = SubscriptionService._calculate_period_end(now, plan.billing_cycle)
             
-            # Create subscription
-            subscription = Subscription.objects.create(
-                user=user,
-                plan=plan,
-                status=status,
-                start_date=start_date,
-                trial_end=trial_end,
-                current_period_start=start_date,
-                current_period_end=period_end,
-                external_customer_id=external_customer_id
-            )
-            
+            # Create subscription. The uniq_active_sub_per_user partial
+            # constraint replaces the old SELECT-then-INSERT pre-check:
+            # one round-trip, and concurrent requests can't both pass.
+            try:
+                subscription = Subscription.objects.create(
+                    user=user,
+                    plan=plan,
+                    status=status,
+                    start_date=start_date,
+                    trial_end=trial_end,
+                    current_period_start=start_date,
+                    current_period_end=period_end,
+                    external_customer_id=external_customer_id
+                )
+            except IntegrityError:
+                raise ValueError("User already has an active subscription")
+
             log_info(
                 "Subscription created via service",
                 user_id=user.id,
@@ -84,15 +123,21 @@ class SubscriptionService:
             if subscription.status in ['canceled', 'unpaid']:
                 raise ValueError("Subscription is already canceled or unpaid")
             
+            # update_fields keeps the UPDATE to the columns actually
+            # touched instead of rewriting the whole row
             if at_period_end:
                 subscription.cancel_at_period_end = True
                 subscription.status = 'active'  # Keep active until period ends
+                subscription.save(
+                    update_fields=['cancel_at_period_end', 'status', 'updated_at']
+                )
             else:
                 subscription.status = 'canceled'
                 subscription.canceled_at = timezone.now()
                 subscription.end_date = timezone.now()
-            
-            subscription.save()
+                subscription.save(
+                    update_fields=['status', 'canceled_at', 'end_date', 'updated_at']
+                )
             
             log_info(
                 "Subscription canceled via service",
@@ -115,8 +160,9 @@ class SubscriptionService:
         Returns:
             Dictionary with subscription status information
         """
-        current_subscription = SubscriptionSelector.get_user_active_subscription(user)
-        available_plans = PlanSelector.get_active_plans()
+        current_subscription = _get_active_subscription_cached(user)
+        # Shared 60-second catalog cache, invalidated on Plan writes
+        available_plans = PlanSelector.get_active_plans_cached()
         
         return {
             "has_active_subscription": current_subscription is not None,
@@ -137,31 +183,22 @@ class SubscriptionService:
             True if user has access, False otherwise
         """
         # Get user's active subscription
-        subscription = SubscriptionSelector.get_user_active_subscription(user)
+        subscription = _get_active_subscription_cached(user)
         
         if not subscription:
             return False
         
-        # Check if feature is enabled in the plan
-        plan_feature = FeatureSelector.get_plan_feature(subscription.plan.id, feature_slug)
+        # Check if feature is enabled in the plan; plan_id reads the FK
+        # column straight off the subscription row without touching the
+        # related object
+        plan_feature = FeatureSelector.get_plan_feature(subscription.plan_id, feature_slug)
         
         if not plan_feature:
             return False
         
-        # Check feature value based on type
-        feature = plan_feature.feature
-        value = plan_feature.value
-        
-        if feature.feature_type == 'boolean':
-            return value.get('enabled', False)
-        elif feature.feature_type == 'numeric':
-            # For numeric features, we'd need to check current usage
-            # This is a simplified version
-            return True
-        elif feature.feature_type == 'unlimited':
-            return True
-        
-        return False
+        # Check feature value based on type; unknown types deny access
+        handler = _FEATURE_TYPE_HANDLERS.get(plan_feature.feature.feature_type)
+        return handler(plan_feature.value) if handler else False
     
     @staticmethod
     def get_user_limits(user) -> Dict[str, Any]:
@@ -174,7 +211,7 @@ class SubscriptionService:
         Returns:
             Dictionary with current limits
         """
-        subscription = SubscriptionSelector.get_user_active_subscription(user)
+        subscription = _get_active_subscription_cached(user)
         
         if not subscription:
             return {
@@ -200,12 +237,9 @@ class SubscriptionService:
     @staticmethod
     def _calculate_period_end(start_date, billing_cycle: str):
         """Calculate the end of the billing period."""
-        if billing_cycle == 'monthly':
-            return start_date + timedelta(days=30)
-        elif billing_cycle == 'quarterly':
-            return start_date + timedelta(days=90)
-        else:  # yearly
-            return start_date + timedelta(days=365)
+        return start_date + SubscriptionService._PERIOD_DELTAS.get(
+            billing_cycle, SubscriptionService._PERIOD_DELTAS['yearly']
+        )
 
 
 class PaymentService:
@@ -243,10 +277,14 @@ class PaymentService:
             description=description
         )
         
+        # Bind the user once: one relation-cache walk instead of two
+        # three-attribute chains (and two lazy SELECT triggers on an
+        # unjoined subscription)
+        user = subscription.user
         log_info(
             "Payment created via service",
-            user_id=subscription.user.id,
-            username=subscription.user.username,
+            user_id=user.id,
+            username=user.username,
             payment_id=payment.pk,
             amount=amount,
             currency=currency
@@ -254,6 +292,76 @@ class PaymentService:
         
         return payment
     
+    @staticmethod
+    def bulk_create_payments(payments: List[Payment]) -> List[Payment]:
+        """
+        Create many payment records in batched INSERTs.
+
+        Args:
+            payments: Unsaved Payment instances to insert
+
+        Returns:
+            List of created Payment instances
+
+        Note:
+            bulk_create bypasses Payment.save() and model signals, so
+            callers must handle any per-payment side effects themselves.
+            Use this for bursty write paths like webhook reconciliation,
+            where one multi-VALUES INSERT replaces N round-trips.
+        """
+        created = Payment.objects.bulk_create(payments, batch_size=500)
+
+        log_info(
+            "Payments bulk created",
+            count=len(created)
+        )
+
+        return created
+
+    @staticmethod
+    def create_payments_bulk(records: List[Dict[str, Any]]) -> List[Payment]:
+        """
+        Create payment records from provider webhook payloads in batches.
+
+        Args:
+            records: Dicts with subscription_id and amount, plus optional
+                currency, status, paid_at, external_payment_id,
+                external_invoice_id and description
+
+        Returns:
+            List of created Payment instances
+
+        Note:
+            Uses ignore_conflicts so redelivered webhook batches skip rows
+            whose external_payment_id already exists instead of failing
+            the whole INSERT. Like bulk_create_payments, this bypasses
+            save() and signals.
+        """
+        payments = [
+            Payment(
+                subscription_id=record['subscription_id'],
+                amount=record['amount'],
+                currency=record.get('currency', 'USD'),
+                status=record.get('status', 'pending'),
+                paid_at=record.get('paid_at'),
+                external_payment_id=record.get('external_payment_id'),
+                external_invoice_id=record.get('external_invoice_id'),
+                description=record.get('description', '')
+            )
+            for record in records
+        ]
+
+        created = Payment.objects.bulk_create(
+            payments, batch_size=500, ignore_conflicts=True
+        )
+
+        log_info(
+            "Payments bulk created from provider records",
+            count=len(created)
+        )
+
+        return created
+
     @staticmethod
     def mark_payment_succeeded(payment: Payment, paid_at=None) -> Payment:
         """
@@ -268,12 +376,13 @@ class PaymentService:
         """
         payment.status = 'succeeded'
         payment.paid_at = paid_at or timezone.now()
-        payment.save()
+        payment.save(update_fields=['status', 'paid_at', 'updated_at'])
         
+        user = payment.subscription.user
         log_info(
             "Payment marked as succeeded",
-            user_id=payment.subscription.user.id,
-            username=payment.subscription.user.username,
+            user_id=user.id,
+            username=user.username,
             payment_id=payment.pk,
             amount=payment.amount
         )
@@ -292,12 +401,13 @@ class PaymentService:
             Updated Payment instance
         """
         payment.status = 'failed'
-        payment.save()
+        payment.save(update_fields=['status', 'updated_at'])
         
+        user = payment.subscription.user
         log_info(
             "Payment marked as failed",
-            user_id=payment.subscription.user.id,
-            username=payment.subscription.user.username,
+            user_id=user.id,
+            username=user.username,
             payment_id=payment.pk,
             amount=payment.amount
         )
@@ -331,13 +441,13 @@ class PlanService:
         """
         if plan.billing_cycle == 'monthly':
             return None
-        
-        monthly_equivalent = plan.monthly_equivalent_price
-        yearly_cost = plan.yearly_price
-        monthly_yearly_cost = monthly_equivalent * 12
-        
-        savings = monthly_yearly_cost - yearly_cost
-        
+
+        # Maintained by the database as a generated column; fall back to
+        # the arithmetic for rows predating the denormalized price columns
+        savings = plan.yearly_savings
+        if savings is None:
+            savings = plan.monthly_equivalent_price * 12 - plan.yearly_price
+
         return savings if savings > 0 else None
     
     @staticmethod
@@ -351,17 +461,16 @@ class PlanService:
         Returns:
             List of feature dictionaries
         """
-        plan_features = FeatureSelector.get_plan_features(plan.pk)
-        
-        features = []
-        for plan_feature in plan_features:
-            features.append({
+        # The selector select_relates feature, so the comprehension walks
+        # already-joined rows instead of issuing one feature SELECT per row
+        return [
+            {
                 "name": plan_feature.feature.name,
                 "slug": plan_feature.feature.slug,
                 "description": plan_feature.feature.description,
                 "category": plan_feature.feature.category,
                 "feature_type": plan_feature.feature.feature_type,
                 "value": plan_feature.value
-            })
-        
-        return features 
\ No newline at end of file
+            }
+            for plan_feature in FeatureSelector.get_plan_features(plan.pk)
+        ] 
\ No newline at end of file
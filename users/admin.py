@@ -83,8 +83,9 @@ class CustomUserAdmin(UserAdmin):
         bmi = obj.get_bmi()
         if bmi is None:
             return '-'
-        
-        category = obj.get_bmi_category()
+
+        # Reuse the BMI computed above instead of deriving it a second time
+        category = obj.get_bmi_category(bmi=bmi)
         color_map = {
             'underweight': 'orange',
             'normal': 'green',
@@ -100,5 +101,15 @@ class CustomUserAdmin(UserAdmin):
     bmi_display.short_description = 'BMI'
     
     def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        return super().get_queryset(request).select_related()
+        """Optimize queryset by deferring JSON columns the changelist never shows.
+
+        The bare select_related() this replaces was a no-op: without
+        arguments it follows no relations on a model whose FKs are only
+        groups/permissions M2Ms. The JSON preference columns can run to
+        multiple KB per row; deferring them trims the changelist payload,
+        at the cost of three small refresh queries on the change form
+        (which this queryset also feeds).
+        """
+        return super().get_queryset(request).defer(
+            'dietary_restrictions', 'allergies', 'preferred_cuisines'
+        )